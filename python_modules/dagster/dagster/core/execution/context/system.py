@@ -25,6 +25,7 @@
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.io_manager import IOManager
 from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.tags import MAX_CONCURRENT_IO_TAG
 from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.core.types.dagster_type import DagsterType
 
@@ -389,6 +390,32 @@ def solid(self) -> "Solid":
     def solid_retry_policy(self) -> Optional[RetryPolicy]:
         return self.pipeline_def.get_retry_policy_for_handle(self.solid_handle)
 
+    @property
+    def max_concurrent_io(self) -> int:
+        """The number of threads that may be used for the io of this step, i.e. to load its inputs
+        and to store the DynamicOutputs it yields concurrently.
+
+        Set via the ``dagster/max_concurrent_io`` tag on the solid, falling back to the same tag
+        on the run. Defaults to 1, i.e. io is performed serially. Even when set, only the IO
+        managers that set ``supports_concurrent_load_input`` or
+        ``supports_concurrent_handle_output`` are called concurrently, since IO managers are not
+        required to be thread-safe.
+        """
+        value = self.step.tags.get(
+            MAX_CONCURRENT_IO_TAG, self.pipeline_run.tags.get(MAX_CONCURRENT_IO_TAG)
+        )
+        if value is None:
+            return 1
+
+        try:
+            max_concurrent_io = int(value)
+        except ValueError:
+            raise DagsterInvariantViolationError(
+                f'Tag "{MAX_CONCURRENT_IO_TAG}" must be an integer, got "{value}".'
+            )
+
+        return max(max_concurrent_io, 1)
+
     def get_io_manager(self, step_output_handle) -> IOManager:
         step_output = self.execution_plan.get_step_output(step_output_handle)
         io_manager_key = (
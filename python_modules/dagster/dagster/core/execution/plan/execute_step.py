@@ -1,5 +1,20 @@
-from collections import defaultdict
-from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from dagster import check
 from dagster.core.definitions import (
@@ -17,18 +32,20 @@
 from dagster.core.definitions.events import AssetLineageInfo, DynamicOutput
 from dagster.core.errors import (
     DagsterExecutionHandleOutputError,
+    DagsterExecutionInterruptedError,
     DagsterInvariantViolationError,
     DagsterStepOutputNotFoundError,
     DagsterTypeCheckDidNotPass,
     DagsterTypeCheckError,
     DagsterTypeMaterializationError,
+    raise_execution_interrupts,
     user_code_error_boundary,
 )
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.output import OutputContext
 from dagster.core.execution.context.system import StepExecutionContext, TypeCheckContext
 from dagster.core.execution.plan.compute import execute_core_compute
-from dagster.core.execution.plan.inputs import StepInputData
+from dagster.core.execution.plan.inputs import FromStepOutput, StepInput, StepInputData
 from dagster.core.execution.plan.objects import StepSuccessData, TypeCheckData
 from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster.core.execution.resolve_versions import resolve_step_output_versions
@@ -46,7 +63,9 @@
 
 
 def _step_output_error_checked_user_event_sequence(
-    step_context: StepExecutionContext, user_event_sequence: Iterator[SolidOutputUnion]
+    step_context: StepExecutionContext,
+    user_event_sequence: Iterator[SolidOutputUnion],
+    output_defs: Dict[str, OutputDefinition],
 ) -> Iterator[SolidOutputUnion]:
     """
     Process the event sequence to check for invariant violations in the event
@@ -56,40 +75,37 @@ def _step_output_error_checked_user_event_sequence(
     """
     check.inst_param(step_context, "step_context", StepExecutionContext)
     check.generator_param(user_event_sequence, "user_event_sequence")
+    check.dict_param(output_defs, "output_defs", key_type=str, value_type=OutputDefinition)
 
     step = step_context.step
-    output_names = list([output_def.name for output_def in step.step_outputs])
     seen_outputs: Set[str] = set()
-    seen_mapping_keys: Dict[str, Set[str]] = defaultdict(set)
+    seen_mapping_keys: Dict[str, Set[str]] = {}
 
     for user_event in user_event_sequence:
-        if not isinstance(user_event, (Output, DynamicOutput)):
+        if isinstance(user_event, Output):
+            is_dynamic_output = False
+        elif isinstance(user_event, DynamicOutput):
+            is_dynamic_output = True
+        else:
             yield user_event
             continue
 
         # do additional processing on Outputs
         output = user_event
-        if not step.has_step_output(output.output_name):
+        output_def = output_defs.get(output.output_name)
+        if output_def is None:
+            output_names = [step_output.name for step_output in step.step_outputs]
             raise DagsterInvariantViolationError(
-                'Core compute for solid "{handle}" returned an output '
-                '"{output.output_name}" that does not exist. The available '
-                "outputs are {output_names}".format(
-                    handle=str(step.solid_handle), output=output, output_names=output_names
-                )
+                f'Core compute for solid "{step.solid_handle}" returned an output '
+                f'"{output.output_name}" that does not exist. The available '
+                f"outputs are {output_names}"
             )
 
-        step_output = step.step_output_named(output.output_name)
-        output_def = step_context.pipeline_def.get_solid(step_output.solid_handle).output_def_named(
-            step_output.name
-        )
-
-        if isinstance(output, Output):
+        if not is_dynamic_output:
             if output.output_name in seen_outputs:
                 raise DagsterInvariantViolationError(
-                    'Compute for solid "{handle}" returned an output '
-                    '"{output.output_name}" multiple times'.format(
-                        handle=str(step.solid_handle), output=output
-                    )
+                    f'Compute for solid "{step.solid_handle}" returned an output '
+                    f'"{output.output_name}" multiple times'
                 )
 
             if output_def.is_dynamic:
@@ -103,32 +119,32 @@ def _step_output_error_checked_user_event_sequence(
                     f'Compute for solid "{step.solid_handle}" yielded a DynamicOutput, '
                     "but did not use DynamicOutputDefinition."
                 )
-            if output.mapping_key in seen_mapping_keys[output.output_name]:
+            mapping_keys = seen_mapping_keys.get(output.output_name)
+            if mapping_keys is None:
+                mapping_keys = seen_mapping_keys[output.output_name] = set()
+            elif output.mapping_key in mapping_keys:
                 raise DagsterInvariantViolationError(
                     f'Compute for solid "{step.solid_handle}" yielded a DynamicOutput with '
                     f'mapping_key "{output.mapping_key}" multiple times.'
                 )
-            seen_mapping_keys[output.output_name].add(output.mapping_key)
+            mapping_keys.add(output.mapping_key)
 
         yield output
         seen_outputs.add(output.output_name)
 
     for step_output in step.step_outputs:
-        step_output_def = step_context.solid_def.output_def_named(step_output.name)
+        step_output_def = output_defs[step_output.name]
         if not step_output_def.name in seen_outputs and not step_output_def.optional:
             if step_output_def.dagster_type.kind == DagsterTypeKind.NOTHING:
                 step_context.log.info(
-                    'Emitting implicit Nothing for output "{output}" on solid {solid}'.format(
-                        output=step_output_def.name, solid={str(step.solid_handle)}
-                    )
+                    f'Emitting implicit Nothing for output "{step_output_def.name}" on solid '
+                    f'"{step.solid_handle}"'
                 )
                 yield Output(output_name=step_output_def.name, value=None)
             elif not step_output_def.is_dynamic:
                 raise DagsterStepOutputNotFoundError(
-                    'Core compute for solid "{handle}" did not return an output '
-                    'for non-optional output "{step_output_def.name}"'.format(
-                        handle=str(step.solid_handle), step_output_def=step_output_def
-                    ),
+                    f'Core compute for solid "{step.solid_handle}" did not return an output '
+                    f'for non-optional output "{step_output_def.name}"',
                     step_key=step.key,
                     output_name=step_output_def.name,
                 )
@@ -151,6 +167,9 @@ def do_type_check(context: TypeCheckContext, dagster_type: DagsterType, value: A
     return type_check
 
 
+_TRIVIAL_TYPECHECK = TypeCheck(success=True)
+
+
 def _create_step_input_event(
     step_context: StepExecutionContext, input_name: str, type_check: TypeCheck, success: bool
 ) -> DagsterEvent:
@@ -181,7 +200,7 @@ def _type_checked_event_sequence_for_input(
         DagsterTypeCheckError,
         lambda: (
             f'Error occurred while type-checking input "{input_name}" of solid '
-            f'"{str(step_context.step.solid_handle)}", with Python type {type(input_value)} and '
+            f'"{step_context.solid_handle}", with Python type {type(input_value)} and '
             f"Dagster type {dagster_type.display_name}"
         ),
     ):
@@ -205,42 +224,54 @@ def _type_checked_event_sequence_for_input(
 
 def _type_check_output(
     step_context: StepExecutionContext,
-    step_output_handle: StepOutputHandle,
-    output: Any,
-    version: Optional[str],
-) -> Iterator[DagsterEvent]:
-    check.inst_param(step_context, "step_context", StepExecutionContext)
-    check.inst_param(output, "output", (Output, DynamicOutput))
-
-    step_output = step_context.step.step_output_named(output.output_name)
-    step_output_def = step_context.solid_def.output_def_named(step_output.name)
+    output: Union[Output, DynamicOutput],
+    output_def: OutputDefinition,
+) -> TypeCheck:
+    dagster_type = output_def.dagster_type
+    if dagster_type.kind == DagsterTypeKind.NOTHING and output.value is None:
+        # the Nothing type check always passes for None, so there is no user code to guard
+        return _TRIVIAL_TYPECHECK
 
-    dagster_type = step_output_def.dagster_type
     with user_code_error_boundary(
         DagsterTypeCheckError,
         lambda: (
             f'Error occurred while type-checking output "{output.output_name}" of solid '
-            f'"{str(step_context.step.solid_handle)}", with Python type {type(output.value)} and '
+            f'"{step_context.solid_handle}", with Python type {type(output.value)} and '
             f"Dagster type {dagster_type.display_name}"
         ),
     ):
-        type_check = do_type_check(step_context.for_type(dagster_type), dagster_type, output.value)
+        return do_type_check(step_context.for_type(dagster_type), dagster_type, output.value)
 
-    yield DagsterEvent.step_output_event(
-        step_context=step_context,
-        step_output_data=StepOutputData(
-            step_output_handle=step_output_handle,
-            type_check_data=TypeCheckData(
-                success=type_check.success,
-                label=step_output_handle.output_name,
-                description=type_check.description if type_check else None,
-                metadata_entries=type_check.metadata_entries if type_check else [],
+
+def _create_step_output_event(
+    step_context: StepExecutionContext,
+    step_output_handle: StepOutputHandle,
+    output: Union[Output, DynamicOutput],
+    version: Optional[str],
+    output_def: OutputDefinition,
+    type_check: TypeCheck,
+    events: List[DagsterEvent],
+) -> None:
+    dagster_type = output_def.dagster_type
+    events.append(
+        DagsterEvent.step_output_event(
+            step_context=step_context,
+            step_output_data=StepOutputData(
+                step_output_handle=step_output_handle,
+                type_check_data=TypeCheckData(
+                    success=type_check.success,
+                    label=step_output_handle.output_name,
+                    description=type_check.description,
+                    metadata_entries=type_check.metadata_entries,
+                ),
+                version=version,
+                metadata_entries=[
+                    entry
+                    for entry in output.metadata_entries
+                    if isinstance(entry, EventMetadataEntry)
+                ],
             ),
-            version=version,
-            metadata_entries=[
-                entry for entry in output.metadata_entries if isinstance(entry, EventMetadataEntry)
-            ],
-        ),
+        )
     )
 
     if not type_check.success:
@@ -254,6 +285,108 @@ def _type_check_output(
         )
 
 
+@contextmanager
+def _io_thread_pool(step_context: StepExecutionContext) -> Iterator[Optional[ThreadPoolExecutor]]:
+    """
+    Thread pool shared by the io performed within a step, or None if the step does not allow
+    concurrent io (see StepExecutionContext.max_concurrent_io).
+    """
+    if step_context.max_concurrent_io <= 1:
+        yield None
+        return
+
+    io_pool = ThreadPoolExecutor(
+        max_workers=step_context.max_concurrent_io,
+        thread_name_prefix=f"{step_context.step.key}_io",
+    )
+    wait = True
+    try:
+        yield io_pool
+    except DagsterExecutionInterruptedError:
+        # the io that is in flight cannot be interrupted, but a terminated step does not wait for
+        # it to complete
+        wait = False
+        raise
+    finally:
+        io_pool.shutdown(wait=wait)
+
+
+def _io_result(future: Future) -> Any:
+    """
+    Wait for io submitted to the io pool. User code on the pool is not interrupted when the run is
+    terminated, since interrupts are only raised on the main thread, so the wait is interrupted
+    instead.
+    """
+    with raise_execution_interrupts():
+        return future.result()
+
+
+def _load_input_objects(
+    step_context: StepExecutionContext,
+    step_inputs: List[StepInput],
+    io_pool: Optional[ThreadPoolExecutor],
+) -> Iterator[Tuple[StepInput, Any]]:
+    """
+    Load the given step inputs, yielding (step_input, event_or_input_value) pairs in input
+    declaration order.
+
+    If an io pool is provided, the inputs that are loaded from upstream outputs by an IOManager
+    that supports concurrent load_input are loaded on it concurrently. Only load_input runs on the
+    pool: the load contexts and events are created on the calling thread in declaration order, so
+    the events are emitted and logged in the same order as for a serial load.
+    """
+    concurrent_loads: Dict[str, Tuple[IOManager, Future]] = {}
+    if io_pool is not None and len(step_inputs) > 1:
+        for step_input in step_inputs:
+            source = step_input.source
+            if not isinstance(source, FromStepOutput):
+                continue
+
+            input_manager = step_context.get_io_manager(source.step_output_handle)
+            if (
+                isinstance(input_manager, IOManager)
+                and input_manager.supports_concurrent_load_input
+            ):
+                concurrent_loads[step_input.name] = (
+                    input_manager,
+                    io_pool.submit(
+                        source.load_input_value,
+                        input_manager,
+                        source.get_load_context(step_context),
+                    ),
+                )
+
+    try:
+        for step_input in step_inputs:
+            if step_input.name in concurrent_loads:
+                input_manager, future = concurrent_loads[step_input.name]
+                source = cast(FromStepOutput, step_input.source)
+                yield step_input, _io_result(future)
+                yield step_input, source.loaded_input_event(step_context, input_manager)
+            else:
+                for event_or_input_value in ensure_gen(
+                    step_input.source.load_input_object(step_context)
+                ):
+                    yield step_input, event_or_input_value
+    except BaseException:
+        # the step fails, so there is no need to load the inputs that have not started loading
+        for _, future in concurrent_loads.values():
+            future.cancel()
+        raise
+
+
+def _supports_concurrent_handle_output(
+    step_context: StepExecutionContext, output_name: str, cache: Dict[str, bool]
+) -> bool:
+    if output_name not in cache:
+        output_manager = step_context.get_io_manager(
+            StepOutputHandle(step_key=step_context.step.key, output_name=output_name)
+        )
+        cache[output_name] = output_manager.supports_concurrent_handle_output
+
+    return cache[output_name]
+
+
 def core_dagster_event_sequence_for_step(
     step_context: StepExecutionContext,
 ) -> Iterator[DagsterEvent]:
@@ -270,89 +403,204 @@ def core_dagster_event_sequence_for_step(
     else:
         yield DagsterEvent.step_start_event(step_context)
 
-    inputs = {}
-    input_lineage = []
+    with _io_thread_pool(step_context) as io_pool:
+        inputs = {}
+        input_lineage = []
+        step_inputs_to_load = []
 
-    for step_input in step_context.step.step_inputs:
-        input_def = step_input.source.get_input_def(step_context.pipeline_def)
-        dagster_type = input_def.dagster_type
+        for step_input in step_context.step.step_inputs:
+            input_def = step_input.source.get_input_def(step_context.pipeline_def)
+            dagster_type = input_def.dagster_type
 
-        if dagster_type.kind == DagsterTypeKind.NOTHING:
-            continue
+            if dagster_type.kind == DagsterTypeKind.NOTHING:
+                continue
 
-        input_lineage.extend(step_input.source.get_asset_lineage(step_context))
+            input_lineage.extend(step_input.source.get_asset_lineage(step_context))
+            step_inputs_to_load.append(step_input)
 
-        for event_or_input_value in ensure_gen(step_input.source.load_input_object(step_context)):
+        for step_input, event_or_input_value in _load_input_objects(
+            step_context, step_inputs_to_load, io_pool
+        ):
             if isinstance(event_or_input_value, DagsterEvent):
                 yield event_or_input_value
             else:
                 check.invariant(step_input.name not in inputs)
                 inputs[step_input.name] = event_or_input_value
 
-    for input_name, input_value in inputs.items():
-        for evt in check.generator(
-            _type_checked_event_sequence_for_input(step_context, input_name, input_value)
-        ):
-            yield evt
-
-    input_lineage = _dedup_asset_lineage(input_lineage)
+        for input_name, input_value in inputs.items():
+            for evt in check.generator(
+                _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+            ):
+                yield evt
+
+        input_lineage = _dedup_asset_lineage(input_lineage)
+
+        # The core execution loop expects a compute generator in a specific format: a generator
+        # that takes a context and dictionary of inputs as input, yields output events. If a solid
+        # definition was generated from the @solid or @lambda_solid decorator, then compute_fn
+        # needs to be coerced into this format. If the solid definition was created directly, then
+        # it is expected that the compute_fn is already in this format.
+        if isinstance(step_context.solid_def.compute_fn, DecoratedSolidFunction):
+            core_gen = create_solid_compute_wrapper(step_context.solid_def)
+        else:
+            core_gen = step_context.solid_def.compute_fn
 
-    # The core execution loop expects a compute generator in a specific format: a generator that
-    # takes a context and dictionary of inputs as input, yields output events. If a solid definition
-    # was generated from the @solid or @lambda_solid decorator, then compute_fn needs to be coerced
-    # into this format. If the solid definition was created directly, then it is expected that the
-    # compute_fn is already in this format.
-    if isinstance(step_context.solid_def.compute_fn, DecoratedSolidFunction):
-        core_gen = create_solid_compute_wrapper(step_context.solid_def)
-    else:
-        core_gen = step_context.solid_def.compute_fn
-
-    with time_execution_scope() as timer_result:
-        user_event_sequence = check.generator(
-            execute_core_compute(
-                step_context,
-                inputs,
-                core_gen,
+        # resolve the definitions of the step outputs once rather than for every yielded output
+        output_defs = {
+            step_output.name: step_context.solid_def.output_def_named(step_output.name)
+            for step_output in step_context.step.step_outputs
+        }
+        materializer_specs = _type_materializer_specs_for_step(step_context)
+        # versions are resolved for the whole plan, so only do so once per step
+        step_output_versions = (
+            resolve_step_output_versions(
+                step_context.pipeline_def,
+                step_context.execution_plan,
+                step_context.resolved_run_config,
             )
+            if MEMOIZED_RUN_TAG in step_context.pipeline.get_definition().tags
+            else None
         )
-
-        # It is important for this loop to be indented within the
-        # timer block above in order for time to be recorded accurately.
-        for user_event in check.generator(
-            _step_output_error_checked_user_event_sequence(step_context, user_event_sequence)
-        ):
-
-            if isinstance(user_event, (Output, DynamicOutput)):
-                for evt in _type_check_and_store_output(step_context, user_event, input_lineage):
-                    yield evt
-            # for now, I'm ignoring AssetMaterializations yielded manually, but we might want
-            # to do something with these in the above path eventually
-            elif isinstance(user_event, (AssetMaterialization, Materialization)):
-                yield DagsterEvent.asset_materialization(step_context, user_event, input_lineage)
-            elif isinstance(user_event, ExpectationResult):
-                yield DagsterEvent.step_expectation_result(step_context, user_event)
-            else:
-                check.failed(
-                    "Unexpected event {event}, should have been caught earlier".format(
-                        event=user_event
+        concurrent_output_names: Dict[str, bool] = {}
+        max_concurrent_io = step_context.max_concurrent_io
+        # outputs are type checked as they are yielded, but their events are created in the order
+        # the outputs were yielded once they have been handled by their IO managers
+        pending_outputs: Deque[_TypeCheckedOutput] = deque()
+        output_events: List[DagsterEvent] = []
+
+        def discard_pending_outputs() -> None:
+            while pending_outputs:
+                handle_output_future = pending_outputs.popleft().handle_output_future
+                if handle_output_future is not None:
+                    # outputs that are already being handled are left to complete, but their
+                    # results are ignored
+                    handle_output_future.cancel()
+
+        def store_pending_outputs(max_pending: int) -> Iterator[DagsterEvent]:
+            while len(pending_outputs) > max_pending:
+                try:
+                    _store_type_checked_output(
+                        step_context,
+                        pending_outputs.popleft(),
+                        input_lineage,
+                        output_defs,
+                        materializer_specs,
+                        step_output_versions,
+                        output_events,
                     )
+                except BaseException:
+                    # as in a serial run, the first output that fails to be stored fails the
+                    # step, and no events are emitted for the outputs yielded after it
+                    discard_pending_outputs()
+                    raise
+                finally:
+                    # events buffered before an error was raised (e.g. the step output event
+                    # of an output that failed its type check) are still emitted
+                    yield from output_events
+                    output_events.clear()
+
+        with time_execution_scope() as timer_result:
+            user_event_sequence = check.generator(
+                execute_core_compute(
+                    step_context,
+                    inputs,
+                    core_gen,
                 )
+            )
+
+            # It is important for this loop to be indented within the
+            # timer block above in order for time to be recorded accurately.
+            try:
+                for user_event in check.generator(
+                    _step_output_error_checked_user_event_sequence(
+                        step_context, user_event_sequence, output_defs
+                    )
+                ):
+                    if isinstance(user_event, (Output, DynamicOutput)):
+                        # there is no data dependency between mapped outputs, so their IO managers
+                        # may store them on the io pool, bounding the number in flight to the
+                        # size of the pool
+                        store_concurrently = (
+                            io_pool is not None
+                            and isinstance(user_event, DynamicOutput)
+                            and _supports_concurrent_handle_output(
+                                step_context, user_event.output_name, concurrent_output_names
+                            )
+                        )
+                        checked_output = _type_check_and_handle_output(
+                            step_context,
+                            user_event,
+                            output_defs[user_event.output_name],
+                            io_pool if store_concurrently else None,
+                        )
+                        pending_outputs.append(checked_output)
+                        yield from store_pending_outputs(
+                            max_concurrent_io
+                            if store_concurrently and checked_output.type_check.success
+                            else 0
+                        )
+                        continue
+
+                    # emit the events for stored outputs before any subsequent events to keep the
+                    # event sequence in the order the outputs were yielded
+                    yield from store_pending_outputs(0)
+
+                    # for now, I'm ignoring AssetMaterializations yielded manually, but we might want
+                    # to do something with these in the above path eventually
+                    if isinstance(user_event, (AssetMaterialization, Materialization)):
+                        yield DagsterEvent.asset_materialization(
+                            step_context, user_event, input_lineage
+                        )
+                    elif isinstance(user_event, ExpectationResult):
+                        yield DagsterEvent.step_expectation_result(step_context, user_event)
+                    else:
+                        check.failed(
+                            "Unexpected event {event}, should have been caught earlier".format(
+                                event=user_event
+                            )
+                        )
+            except DagsterExecutionInterruptedError:
+                discard_pending_outputs()
+                raise
+            except Exception:
+                # outputs that have already been handed to their IO managers have been stored, so
+                # their events are emitted before the error propagates
+                yield from store_pending_outputs(0)
+                raise
+
+            yield from store_pending_outputs(0)
 
     yield DagsterEvent.step_success_event(
         step_context, StepSuccessData(duration_ms=timer_result.millis)
     )
 
 
-def _type_check_and_store_output(
-    step_context: StepExecutionContext,
-    output: Union[DynamicOutput, Output],
-    input_lineage: List[AssetLineageInfo],
-) -> Iterator[DagsterEvent]:
+class _TypeCheckedOutput(NamedTuple):
+    """An output that has been type checked, but whose events have not yet been created."""
+
+    output: Union[Output, DynamicOutput]
+    step_output_handle: StepOutputHandle
+    type_check: TypeCheck
+    output_manager: IOManager
+    output_context: OutputContext
+    # set if the output is being handed to its IO manager on the io pool
+    handle_output_future: Optional[Future]
 
-    check.inst_param(step_context, "step_context", StepExecutionContext)
-    check.inst_param(output, "output", (Output, DynamicOutput))
-    check.list_param(input_lineage, "input_lineage", AssetLineageInfo)
 
+def _type_check_and_handle_output(
+    step_context: StepExecutionContext,
+    output: Union[Output, DynamicOutput],
+    output_def: OutputDefinition,
+    io_pool: Optional[ThreadPoolExecutor],
+) -> _TypeCheckedOutput:
+    """
+    Type check an output as it is yielded. If an io pool is given and the type check passed, the
+    output is handed to its IO manager on the pool right away, otherwise it is handed over once it
+    is stored. Only handle_output runs on the pool, so type checks, type materializers and the
+    creation of events all happen on the step's thread.
+    """
+    # called for every output the step yields, with arguments that are all constructed within
+    # core_dagster_event_sequence_for_step, so the parameters are not re-checked here
     mapping_key = output.mapping_key if isinstance(output, DynamicOutput) else None
 
     step_output_handle = StepOutputHandle(
@@ -366,22 +614,82 @@ def _type_check_and_store_output(
     # capture output at the step level for threading th computed output values to hook context
     step_context.step_output_capture[step_output_handle] = output.value
 
-    version = (
-        resolve_step_output_versions(
-            step_context.pipeline_def, step_context.execution_plan, step_context.resolved_run_config
-        ).get(step_output_handle)
-        if MEMOIZED_RUN_TAG in step_context.pipeline.get_definition().tags
+    type_check = _type_check_output(step_context, output, output_def)
+
+    output_manager = step_context.get_io_manager(step_output_handle)
+    output_context = step_context.get_output_context(step_output_handle)
+    handle_output_future = (
+        io_pool.submit(_handle_output, step_context, output_manager, output_context, output.value)
+        if io_pool is not None and type_check.success
         else None
     )
 
-    for output_event in _type_check_output(step_context, step_output_handle, output, version):
-        yield output_event
+    return _TypeCheckedOutput(
+        output=output,
+        step_output_handle=step_output_handle,
+        type_check=type_check,
+        output_manager=output_manager,
+        output_context=output_context,
+        handle_output_future=handle_output_future,
+    )
+
 
-    for evt in _store_output(step_context, step_output_handle, output, input_lineage):
-        yield evt
+def _store_type_checked_output(
+    step_context: StepExecutionContext,
+    checked_output: _TypeCheckedOutput,
+    input_lineage: List[AssetLineageInfo],
+    output_defs: Dict[str, OutputDefinition],
+    materializer_specs: Dict[str, List[Any]],
+    step_output_versions: Optional[Dict[StepOutputHandle, Optional[str]]],
+    events: List[DagsterEvent],
+) -> None:
+    """
+    Store a type checked output, appending the resulting events to ``events``. Events are
+    appended in the order they are to be emitted, so any that were appended before an error was
+    raised should still be emitted by the caller.
+    """
+    output = checked_output.output
+    step_output_handle = checked_output.step_output_handle
+    output_def = output_defs[output.output_name]
 
-    for evt in _create_type_materializations(step_context, output.output_name, output.value):
-        yield evt
+    version = (
+        step_output_versions.get(step_output_handle) if step_output_versions is not None else None
+    )
+
+    _create_step_output_event(
+        step_context,
+        step_output_handle,
+        output,
+        version,
+        output_def,
+        checked_output.type_check,
+        events,
+    )
+
+    handle_output_elts = (
+        _io_result(checked_output.handle_output_future)
+        if checked_output.handle_output_future is not None
+        else _handle_output(
+            step_context, checked_output.output_manager, checked_output.output_context, output.value
+        )
+    )
+
+    _store_output(
+        step_context,
+        step_output_handle,
+        output,
+        input_lineage,
+        output_def,
+        checked_output.output_manager,
+        checked_output.output_context,
+        handle_output_elts,
+        events,
+    )
+
+    # most outputs have no type materializers configured
+    output_specs = materializer_specs.get(output.output_name)
+    if output_specs:
+        _create_type_materializations(step_context, output_def, output.value, output_specs, events)
 
 
 def _asset_key_and_partitions_for_output(
@@ -417,13 +725,15 @@ def _dedup_asset_lineage(asset_lineage: List[AssetLineageInfo]) -> List[AssetLin
     with multiple Outputs, which in turn have multiple Inputs (because each Output of the solid will
     inherit all dependencies from all of the solid Inputs).
     """
-    key_partition_mapping: Dict[AssetKey, Set[str]] = defaultdict(set)
+    key_partition_mapping: Dict[AssetKey, Set[str]] = {}
 
     for lineage_info in asset_lineage:
-        if not lineage_info.partitions:
-            key_partition_mapping[lineage_info.asset_key] |= set()
-        for partition in lineage_info.partitions:
-            key_partition_mapping[lineage_info.asset_key].add(partition)
+        partitions = key_partition_mapping.get(lineage_info.asset_key)
+        if partitions is None:
+            key_partition_mapping[lineage_info.asset_key] = set(lineage_info.partitions)
+        else:
+            partitions.update(lineage_info.partitions)
+
     return [
         AssetLineageInfo(asset_key=asset_key, partitions=partitions)
         for asset_key, partitions in key_partition_mapping.items()
@@ -436,17 +746,26 @@ def _get_output_asset_materializations(
     output: Union[Output, DynamicOutput],
     output_def: OutputDefinition,
     io_manager_metadata_entries: List[Union[EventMetadataEntry, PartitionMetadataEntry]],
-) -> Iterator[AssetMaterialization]:
+) -> List[AssetMaterialization]:
 
     all_metadata = output.metadata_entries + io_manager_metadata_entries
 
     if asset_partitions:
-        metadata_mapping: Dict[str, List[Union[str, "EventMetadataEntry"]]] = {
+        # entries are only split up by partition when some entry targets a specific partition
+        if not any(isinstance(entry, PartitionMetadataEntry) for entry in all_metadata):
+            return [
+                AssetMaterialization(
+                    asset_key=asset_key, partition=partition, metadata_entries=list(all_metadata)
+                )
+                for partition in asset_partitions
+            ]
+
+        metadata_mapping: Dict[str, List[EventMetadataEntry]] = {
             partition: [] for partition in asset_partitions
         }
         for entry in all_metadata:
-            # if you target a given entry at a partition, only apply it to the requested partition
-            # otherwise, apply it to all partitions
+            # partition-specific entries only apply to their partition, all others apply to every
+            # partition; either way each partition keeps the entries in declaration order
             if isinstance(entry, PartitionMetadataEntry):
                 if entry.partition not in asset_partitions:
                     raise DagsterInvariantViolationError(
@@ -455,15 +774,17 @@ def _get_output_asset_materializations(
                     )
                 metadata_mapping[entry.partition].append(entry.entry)
             else:
-                for partition in metadata_mapping.keys():
-                    metadata_mapping[partition].append(entry)
+                for partition_entries in metadata_mapping.values():
+                    partition_entries.append(entry)
 
-        for partition in asset_partitions:
-            yield AssetMaterialization(
+        return [
+            AssetMaterialization(
                 asset_key=asset_key,
                 partition=partition,
                 metadata_entries=metadata_mapping[partition],
             )
+            for partition in asset_partitions
+        ]
     else:
         for entry in all_metadata:
             if isinstance(entry, PartitionMetadataEntry):
@@ -471,26 +792,32 @@ def _get_output_asset_materializations(
                     f"Output {output_def.name} got a PartitionMetadataEntry ({entry}), but "
                     "is not associated with any specific partitions."
                 )
-        yield AssetMaterialization(asset_key=asset_key, metadata_entries=all_metadata)
+        return [AssetMaterialization(asset_key=asset_key, metadata_entries=all_metadata)]
 
 
-def _store_output(
+def _handle_output(
     step_context: StepExecutionContext,
-    step_output_handle: StepOutputHandle,
-    output: Union[Output, DynamicOutput],
-    input_lineage: List[AssetLineageInfo],
-) -> Iterator[DagsterEvent]:
+    output_manager: IOManager,
+    output_context: OutputContext,
+    value: Any,
+) -> Sequence[Any]:
+    """
+    Hand an output's value to its IO manager, returning what handle_output returned or yielded.
+    Only user code runs here, so this may be called off of the step's thread.
+    """
+    handle_output_res = output_manager.handle_output(output_context, value)
 
-    output_def = step_context.solid_def.output_def_named(step_output_handle.output_name)
-    output_manager = step_context.get_io_manager(step_output_handle)
-    output_context = step_context.get_output_context(step_output_handle)
+    if handle_output_res is None:
+        return []
 
-    handle_output_res = output_manager.handle_output(output_context, output.value)
+    # exact type check, since AssetMaterialization and EventMetadataEntry are namedtuples
+    if type(handle_output_res) in (list, tuple):
+        # no user code runs while iterating a returned collection, so there is no need to
+        # wrap it in a generator and re-enter the error boundary for each element
+        return handle_output_res
 
-    manager_materializations = []
-    manager_metadata_entries = []
-    if handle_output_res is not None:
-        for elt in iterate_with_context(
+    return list(
+        iterate_with_context(
             lambda: solid_execution_error_boundary(
                 DagsterExecutionHandleOutputError,
                 msg_fn=lambda: (
@@ -502,24 +829,44 @@ def _store_output(
                 output_name=output_context.name,
             ),
             ensure_gen(handle_output_res),
-        ):
-            if isinstance(elt, AssetMaterialization):
-                manager_materializations.append(elt)
-            elif isinstance(elt, (EventMetadataEntry, PartitionMetadataEntry)):
-                experimental_functionality_warning(
-                    "Yielding metadata from an IOManager's handle_output() function"
-                )
-                manager_metadata_entries.append(elt)
-            else:
-                raise DagsterInvariantViolationError(
-                    f"IO manager on output {output_def.name} has returned "
-                    f"value {elt} of type {type(elt).__name__}. The return type can only be "
-                    "one of AssetMaterialization, EventMetadataEntry, PartitionMetadataEntry."
-                )
+        )
+    )
+
+
+def _store_output(
+    step_context: StepExecutionContext,
+    step_output_handle: StepOutputHandle,
+    output: Union[Output, DynamicOutput],
+    input_lineage: List[AssetLineageInfo],
+    output_def: OutputDefinition,
+    output_manager: IOManager,
+    output_context: OutputContext,
+    handle_output_elts: Sequence[Any],
+    events: List[DagsterEvent],
+) -> None:
+
+    manager_materializations = []
+    manager_metadata_entries = []
+    for elt in handle_output_elts:
+        if isinstance(elt, AssetMaterialization):
+            manager_materializations.append(elt)
+        elif isinstance(elt, (EventMetadataEntry, PartitionMetadataEntry)):
+            experimental_functionality_warning(
+                "Yielding metadata from an IOManager's handle_output() function"
+            )
+            manager_metadata_entries.append(elt)
+        else:
+            raise DagsterInvariantViolationError(
+                f"IO manager on output {output_def.name} has returned "
+                f"value {elt} of type {type(elt).__name__}. The return type can only be "
+                "one of AssetMaterialization, EventMetadataEntry, PartitionMetadataEntry."
+            )
 
     # do not alter explicitly created AssetMaterializations
     for materialization in manager_materializations:
-        yield DagsterEvent.asset_materialization(step_context, materialization, input_lineage)
+        events.append(
+            DagsterEvent.asset_materialization(step_context, materialization, input_lineage)
+        )
 
     asset_key, partitions = _asset_key_and_partitions_for_output(
         output_context, output_def, output_manager
@@ -532,28 +879,33 @@ def _store_output(
             output_def,
             manager_metadata_entries,
         ):
-            yield DagsterEvent.asset_materialization(step_context, materialization, input_lineage)
+            events.append(
+                DagsterEvent.asset_materialization(step_context, materialization, input_lineage)
+            )
 
-    yield DagsterEvent.handled_output(
-        step_context,
-        output_name=step_output_handle.output_name,
-        manager_key=output_def.io_manager_key,
-        message_override=f'Handled input "{step_output_handle.output_name}" using intermediate storage'
-        if isinstance(output_manager, IntermediateStorageAdapter)
-        else None,
-        metadata_entries=[
-            entry for entry in manager_metadata_entries if isinstance(entry, EventMetadataEntry)
-        ],
+    events.append(
+        DagsterEvent.handled_output(
+            step_context,
+            output_name=step_output_handle.output_name,
+            manager_key=output_def.io_manager_key,
+            message_override=f'Handled input "{step_output_handle.output_name}" using intermediate storage'
+            if isinstance(output_manager, IntermediateStorageAdapter)
+            else None,
+            metadata_entries=[
+                entry for entry in manager_metadata_entries if isinstance(entry, EventMetadataEntry)
+            ],
+        )
     )
 
 
-def _create_type_materializations(
-    step_context: StepExecutionContext, output_name: str, value: Any
-) -> Iterator[DagsterEvent]:
-    """If the output has any dagster type materializers, runs them."""
+def _type_materializer_specs_for_step(step_context: StepExecutionContext) -> Dict[str, List[Any]]:
+    """
+    Map the names of the step's outputs to the type materializer config specified for them,
+    collected once per step rather than for every yielded output.
+    """
 
-    step = step_context.step
-    current_handle = step.solid_handle
+    materializer_specs: Dict[str, List[Any]] = {}
+    current_handle = step_context.step.solid_handle
 
     # check for output mappings at every point up the composition hierarchy
     while current_handle:
@@ -566,35 +918,48 @@ def _create_type_materializations(
         for output_spec in solid_config.outputs.type_materializer_specs:
             check.invariant(len(output_spec) == 1)
             config_output_name, output_spec = list(output_spec.items())[0]
-            if config_output_name == output_name:
-                step_output = step.step_output_named(output_name)
-                with user_code_error_boundary(
-                    DagsterTypeMaterializationError,
-                    msg_fn=lambda: (
-                        "Error occurred during output materialization:"
-                        f'\n    output name: "{output_name}"'
-                        f'\n    solid invocation: "{step_context.solid.name}"'
-                        f'\n    solid definition: "{step_context.solid_def.name}"'
-                    ),
-                ):
-                    output_def = step_context.solid_def.output_def_named(step_output.name)
-                    dagster_type = output_def.dagster_type
-                    materializations = dagster_type.materializer.materialize_runtime_values(
-                        step_context, output_spec, value
-                    )
+            materializer_specs.setdefault(config_output_name, []).append(output_spec)
 
-                for materialization in materializations:
-                    if not isinstance(materialization, (AssetMaterialization, Materialization)):
-                        raise DagsterInvariantViolationError(
-                            (
-                                "materialize_runtime_values on type {type_name} has returned "
-                                "value {value} of type {python_type}. You must return an "
-                                "AssetMaterialization."
-                            ).format(
-                                type_name=dagster_type.display_name,
-                                value=repr(materialization),
-                                python_type=type(materialization).__name__,
-                            )
-                        )
+    return materializer_specs
+
+
+def _create_type_materializations(
+    step_context: StepExecutionContext,
+    output_def: OutputDefinition,
+    value: Any,
+    output_specs: List[Any],
+    events: List[DagsterEvent],
+) -> None:
+    """If the output has any dagster type materializers, runs them."""
+
+    dagster_type = output_def.dagster_type
+
+    for output_spec in output_specs:
+        with user_code_error_boundary(
+            DagsterTypeMaterializationError,
+            msg_fn=lambda: (
+                "Error occurred during output materialization:"
+                f'\n    output name: "{output_def.name}"'
+                f'\n    solid invocation: "{step_context.solid.name}"'
+                f'\n    solid definition: "{step_context.solid_def.name}"'
+            ),
+        ):
+            materializations = dagster_type.materializer.materialize_runtime_values(
+                step_context, output_spec, value
+            )
+
+        for materialization in materializations:
+            if not isinstance(materialization, (AssetMaterialization, Materialization)):
+                raise DagsterInvariantViolationError(
+                    (
+                        "materialize_runtime_values on type {type_name} has returned "
+                        "value {value} of type {python_type}. You must return an "
+                        "AssetMaterialization."
+                    ).format(
+                        type_name=dagster_type.display_name,
+                        value=repr(materialization),
+                        python_type=type(materialization).__name__,
+                    )
+                )
 
-                    yield DagsterEvent.asset_materialization(step_context, materialization)
+            events.append(DagsterEvent.asset_materialization(step_context, materialization))
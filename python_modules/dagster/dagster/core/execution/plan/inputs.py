@@ -46,6 +46,8 @@ class StepInputData(
 ):
     """"Serializable payload of information for the result of processing a step input"""
 
+    __slots__ = ()
+
     def __new__(cls, input_name: str, type_check_data: TypeCheckData):
         return super(StepInputData, cls).__new__(
             cls,
@@ -231,10 +233,7 @@ def get_load_context(self, step_context: "StepExecutionContext") -> "InputContex
             resources,
         )
 
-    def load_input_object(self, step_context: "StepExecutionContext") -> Iterator["DagsterEvent"]:
-        from dagster.core.events import DagsterEvent
-        from dagster.core.storage.intermediate_storage import IntermediateStorageAdapter
-
+    def get_input_manager(self, step_context: "StepExecutionContext") -> IOManager:
         source_handle = self.step_output_handle
         manager_key = step_context.execution_plan.get_manager_key(
             source_handle, step_context.pipeline_def
@@ -248,8 +247,31 @@ def load_input_object(self, step_context: "StepExecutionContext") -> Iterator["D
             f"Please ensure that the resource returned for resource key "
             f'"{manager_key}" is an IOManager.',
         )
-        yield _load_input_with_input_manager(input_manager, self.get_load_context(step_context))
-        yield DagsterEvent.loaded_input(
+        return input_manager
+
+    def load_input_object(self, step_context: "StepExecutionContext") -> Iterator["DagsterEvent"]:
+        input_manager = self.get_input_manager(step_context)
+        yield self.load_input_value(input_manager, self.get_load_context(step_context))
+        yield self.loaded_input_event(step_context, input_manager)
+
+    def load_input_value(self, input_manager: IOManager, load_context: "InputContext") -> Any:
+        """
+        Load the input with the given manager and load context, without emitting any events. Only
+        user code runs here, so this may be called off of the thread executing the step.
+        """
+        return _load_input_with_input_manager(input_manager, load_context)
+
+    def loaded_input_event(
+        self, step_context: "StepExecutionContext", input_manager: IOManager
+    ) -> "DagsterEvent":
+        from dagster.core.events import DagsterEvent
+        from dagster.core.storage.intermediate_storage import IntermediateStorageAdapter
+
+        source_handle = self.step_output_handle
+        manager_key = step_context.execution_plan.get_manager_key(
+            source_handle, step_context.pipeline_def
+        )
+        return DagsterEvent.loaded_input(
             step_context,
             input_name=self.input_name,
             manager_key=manager_key,
@@ -23,6 +23,8 @@ class TypeCheckData(
         ],
     )
 ):
+    __slots__ = ()
+
     def __new__(cls, success, label, description=None, metadata_entries=None):
         return super(TypeCheckData, cls).__new__(
             cls,
@@ -144,6 +146,8 @@ def __new__(cls, error, seconds_to_wait=None):
 
 @whitelist_for_serdes
 class StepSuccessData(NamedTuple("_StepSuccessData", [("duration_ms", float)])):
+    __slots__ = ()
+
     def __new__(cls, duration_ms):
         return super(StepSuccessData, cls).__new__(
             cls, duration_ms=check.float_param(duration_ms, "duration_ms")
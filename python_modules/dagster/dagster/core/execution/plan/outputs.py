@@ -100,6 +100,8 @@ class StepOutputData(
 ):
     """Serializable payload of information for the result of processing a step output"""
 
+    __slots__ = ()
+
     def __new__(
         cls,
         step_output_handle: "StepOutputHandle",
@@ -140,6 +142,8 @@ class StepOutputHandle(
 ):
     """A reference to a specific output that has or will occur within the scope of an execution"""
 
+    __slots__ = ()
+
     def __new__(cls, step_key: str, output_name: str = "result", mapping_key: Optional[str] = None):
         return super(StepOutputHandle, cls).__new__(
             cls,
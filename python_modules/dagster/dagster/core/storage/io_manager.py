@@ -98,8 +98,19 @@ class IOManager(InputManager, OutputManager):
 
     Extend this class to handle how objects are loaded and stored. Users should implement
     ``handle_output`` to store an object and ``load_input`` to retrieve an object.
+
+    Set ``supports_concurrent_load_input`` to True on an IOManager whose ``load_input`` is safe to
+    call from multiple threads at once. When a step allows concurrent io, the inputs it loads with
+    such an IOManager are then loaded concurrently. Likewise, set
+    ``supports_concurrent_handle_output`` to True on an IOManager whose ``handle_output`` is safe to
+    call from multiple threads at once, so that the DynamicOutputs a step yields to it are stored
+    concurrently. Calls that run concurrently are made off of the main thread, so they are not
+    interrupted when the run is terminated, although the step stops waiting for them.
     """
 
+    supports_concurrent_load_input = False
+    supports_concurrent_handle_output = False
+
     @abstractmethod
     def load_input(self, context):
         """User-defined method that loads an input to a solid.
@@ -2,6 +2,9 @@
 
 
 class InMemoryIOManager(IOManager):
+    supports_concurrent_load_input = True
+    supports_concurrent_handle_output = True
+
     def __init__(self):
         self.values = {}
 
@@ -39,6 +39,8 @@
 
 DOCKER_IMAGE_TAG = "{prefix}image".format(prefix=SYSTEM_TAG_PREFIX)
 
+MAX_CONCURRENT_IO_TAG = "{prefix}max_concurrent_io".format(prefix=SYSTEM_TAG_PREFIX)
+
 USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG]
 
 
@@ -1,8 +1,21 @@
+import threading
+
 import pytest
-from dagster import execute_pipeline, execute_solid, pipeline, solid
+from dagster import (
+    DagsterInstance,
+    DagsterType,
+    ModeDefinition,
+    execute_pipeline,
+    execute_solid,
+    io_manager,
+    pipeline,
+    solid,
+)
 from dagster.core.definitions.events import Output
 from dagster.core.definitions.output import OutputDefinition
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+from dagster.core.storage.mem_io_manager import InMemoryIOManager
+from dagster.core.storage.tags import MAX_CONCURRENT_IO_TAG
 from dagster.experimental import DynamicOutput, DynamicOutputDefinition
 
 
@@ -137,3 +150,174 @@ def destructure():
     assert result.result_for_solid("echo_a").output_value() == [1]
     assert result.result_for_solid("echo_b").output_value() == [2, 3]
     assert result.result_for_solid("echo_c").skipped  # all fanned in inputs skipped -> solid skips
+
+
+def test_concurrent_handle_output():
+    # outputs are stored in pairs, each of which must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=10)
+    # store the second output of each pair first, so that outputs complete out of order
+    stored = {str(i): threading.Event() for i in range(4)}
+    type_check_threads = []
+
+    class BarrierIOManager(InMemoryIOManager):
+        def handle_output(self, context, obj):
+            barrier.wait()
+            if int(context.mapping_key) % 2 == 0:
+                assert stored[str(int(context.mapping_key) + 1)].wait(timeout=10)
+            super(BarrierIOManager, self).handle_output(context, obj)
+            stored[context.mapping_key].set()
+
+    @io_manager
+    def barrier_io_manager(_):
+        return BarrierIOManager()
+
+    def _type_check(_, value):
+        type_check_threads.append(threading.current_thread())
+        return isinstance(value, int)
+
+    @solid(
+        output_defs=[
+            DynamicOutputDefinition(DagsterType(type_check_fn=_type_check, name="CheckedInt"))
+        ]
+    )
+    def emit():
+        for i in range(4):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": barrier_io_manager})])
+    def concurrent_pipeline():
+        emit()
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        concurrent_pipeline, tags={MAX_CONCURRENT_IO_TAG: "2"}, instance=instance
+    )
+    assert result.success
+    assert result.result_for_solid("emit").output_value() == {"0": 0, "1": 1, "2": 2, "3": 3}
+    assert [
+        event.event_specific_data.mapping_key
+        for event in result.step_event_list
+        if event.event_type_value == "STEP_OUTPUT"
+    ] == ["0", "1", "2", "3"]
+    assert type_check_threads == [threading.current_thread()] * 4
+
+    logged_events = [
+        record.dagster_event
+        for record in instance.all_logs(result.run_id)
+        if record.is_dagster_event
+        and record.dagster_event.event_type_value in ("STEP_OUTPUT", "HANDLED_OUTPUT")
+    ]
+    assert [event.event_type_value for event in logged_events] == [
+        "STEP_OUTPUT",
+        "HANDLED_OUTPUT",
+    ] * 4
+    assert [
+        event.event_specific_data.mapping_key
+        for event in logged_events
+        if event.event_type_value == "STEP_OUTPUT"
+    ] == ["0", "1", "2", "3"]
+
+
+def _step_events(result):
+    return [
+        (
+            event.event_type_value,
+            event.event_specific_data.mapping_key
+            if event.event_type_value == "STEP_OUTPUT"
+            else None,
+        )
+        for event in result.step_event_list
+    ]
+
+
+def test_concurrent_handle_output_type_check_failure():
+    @solid(
+        output_defs=[
+            DynamicOutputDefinition(
+                DagsterType(type_check_fn=lambda _, value: value != 2, name="NotTwo")
+            )
+        ]
+    )
+    def emit():
+        for i in range(4):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @pipeline
+    def type_check_pipeline():
+        emit()
+
+    serial_result = execute_pipeline(type_check_pipeline, raise_on_error=False)
+    concurrent_result = execute_pipeline(
+        type_check_pipeline, tags={MAX_CONCURRENT_IO_TAG: "2"}, raise_on_error=False
+    )
+
+    assert not concurrent_result.success
+    assert _step_events(concurrent_result) == _step_events(serial_result)
+    assert ("STEP_OUTPUT", "2") in _step_events(concurrent_result)
+    assert _step_events(concurrent_result)[-1] == ("STEP_FAILURE", None)
+
+
+def test_concurrent_handle_output_compute_failure():
+    @solid(output_defs=[DynamicOutputDefinition()])
+    def emit():
+        yield DynamicOutput(0, mapping_key="0")
+        yield DynamicOutput(1, mapping_key="1")
+        raise Exception("compute failed")
+
+    @pipeline
+    def failing_pipeline():
+        emit()
+
+    result = execute_pipeline(
+        failing_pipeline, tags={MAX_CONCURRENT_IO_TAG: "4"}, raise_on_error=False
+    )
+
+    assert not result.success
+    assert _step_events(result) == [
+        ("STEP_START", None),
+        ("STEP_OUTPUT", "0"),
+        ("HANDLED_OUTPUT", None),
+        ("STEP_OUTPUT", "1"),
+        ("HANDLED_OUTPUT", None),
+        ("STEP_FAILURE", None),
+    ]
+
+
+@pytest.mark.parametrize("num_outputs", [3, 6])
+def test_concurrent_handle_output_failure(num_outputs):
+    class FailingIOManager(InMemoryIOManager):
+        def handle_output(self, context, obj):
+            if context.mapping_key in ("1", "2"):
+                raise Exception(f"boom {context.mapping_key}")
+            super(FailingIOManager, self).handle_output(context, obj)
+
+    @io_manager
+    def failing_io_manager(_):
+        return FailingIOManager()
+
+    @solid(output_defs=[DynamicOutputDefinition()])
+    def emit():
+        for i in range(num_outputs):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": failing_io_manager})])
+    def failing_pipeline():
+        emit()
+
+    serial_result = execute_pipeline(failing_pipeline, raise_on_error=False)
+    concurrent_result = execute_pipeline(
+        failing_pipeline, tags={MAX_CONCURRENT_IO_TAG: "2"}, raise_on_error=False
+    )
+
+    assert not concurrent_result.success
+    # no events are emitted for the outputs yielded after the first one that failed to be stored
+    assert _step_events(concurrent_result) == _step_events(serial_result)
+    assert _step_events(concurrent_result) == [
+        ("STEP_START", None),
+        ("STEP_OUTPUT", "0"),
+        ("HANDLED_OUTPUT", None),
+        ("STEP_OUTPUT", "1"),
+        ("STEP_FAILURE", None),
+    ]
+    step_failure = concurrent_result.step_event_list[-1]
+    assert "boom 1" in step_failure.event_specific_data.error.message
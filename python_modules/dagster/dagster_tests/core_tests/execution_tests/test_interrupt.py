@@ -1,6 +1,7 @@
 import os
 import signal
 import tempfile
+import threading
 import time
 from threading import Thread
 
@@ -11,6 +12,7 @@
     ModeDefinition,
     String,
     execute_pipeline_iterator,
+    io_manager,
     pipeline,
     reconstructable,
     resource,
@@ -18,6 +20,9 @@
     solid,
 )
 from dagster.core.errors import DagsterExecutionInterruptedError, raise_execution_interrupts
+from dagster.core.storage.mem_io_manager import InMemoryIOManager
+from dagster.core.storage.tags import MAX_CONCURRENT_IO_TAG
+from dagster.experimental import DynamicOutput, DynamicOutputDefinition
 from dagster.core.test_utils import instance_for_test
 from dagster.utils import safe_tempfile_path, send_interrupt
 from dagster.utils.interrupts import capture_interrupts, check_captured_interrupt
@@ -91,6 +96,90 @@ def write_a_file_pipeline():
         )
 
 
+def _send_kbd_int_when_set(event):
+    assert event.wait(timeout=30)
+    send_interrupt()
+
+
+def _execute_interrupted(pipeline_def, release):
+    start_time = time.time()
+    try:
+        event_types = [
+            event.event_type
+            for event in execute_pipeline_iterator(pipeline_def, tags={MAX_CONCURRENT_IO_TAG: "2"})
+        ]
+    finally:
+        release.set()
+
+    # the step does not wait for the io that is in flight on the io pool to complete
+    assert time.time() - start_time < 20
+    assert DagsterEventType.STEP_FAILURE in event_types
+    assert DagsterEventType.PIPELINE_FAILURE in event_types
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
+def test_interrupt_concurrent_handle_output():
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingIOManager(InMemoryIOManager):
+        def handle_output(self, context, obj):
+            started.set()
+            release.wait(timeout=30)
+            super(BlockingIOManager, self).handle_output(context, obj)
+
+    @io_manager
+    def blocking_io_manager(_):
+        return BlockingIOManager()
+
+    @solid(output_defs=[DynamicOutputDefinition()])
+    def emit():
+        yield DynamicOutput(1, mapping_key="1")
+        yield DynamicOutput(2, mapping_key="2")
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": blocking_io_manager})])
+    def blocking_pipeline():
+        emit()
+
+    Thread(target=_send_kbd_int_when_set, args=(started,)).start()
+    _execute_interrupted(blocking_pipeline, release)
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
+def test_interrupt_concurrent_load_input():
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingIOManager(InMemoryIOManager):
+        def load_input(self, context):
+            started.set()
+            release.wait(timeout=30)
+            return super(BlockingIOManager, self).load_input(context)
+
+    @io_manager
+    def blocking_io_manager(_):
+        return BlockingIOManager()
+
+    @solid
+    def emit_one():
+        return 1
+
+    @solid
+    def emit_two():
+        return 2
+
+    @solid
+    def add(_, a, b):
+        return a + b
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": blocking_io_manager})])
+    def blocking_pipeline():
+        add(emit_one(), emit_two())
+
+    Thread(target=_send_kbd_int_when_set, args=(started,)).start()
+    _execute_interrupted(blocking_pipeline, release)
+
+
 @pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
 def test_interrupt_multiproc():
     with tempfile.TemporaryDirectory() as tempdir:
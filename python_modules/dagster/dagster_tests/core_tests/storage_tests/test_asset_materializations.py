@@ -131,6 +131,69 @@ def my_pipeline():
     )
 
 
+def test_partition_metadata_declaration_order():
+
+    entry1 = EventMetadataEntry.int(123, "nrows")
+    entry2 = EventMetadataEntry.float(3.21, "some value")
+
+    @solid(
+        output_defs=[
+            OutputDefinition(
+                name="output1", asset_key=AssetKey("table1"), asset_partitions=set(["0", "1"])
+            )
+        ]
+    )
+    def solid1(_):
+        return Output(
+            None,
+            "output1",
+            metadata_entries=[PartitionMetadataEntry("0", entry1), entry2],
+        )
+
+    @pipeline
+    def my_pipeline():
+        solid1()
+
+    result = execute_pipeline(my_pipeline)
+    materializations = [
+        event
+        for event in result.step_event_list
+        if event.event_type_value == "ASSET_MATERIALIZATION"
+    ]
+    assert len(materializations) == 2
+
+    metadata_by_partition = {
+        materialization.partition: materialization.event_specific_data.materialization.metadata_entries
+        for materialization in materializations
+    }
+    assert metadata_by_partition == {"0": [entry1, entry2], "1": [entry2]}
+
+
+def test_materialization_metadata_not_shared_with_output():
+
+    output_metadata = [EventMetadataEntry.int(123, "nrows")]
+
+    @solid(output_defs=[OutputDefinition(name="output1", asset_key=AssetKey("table1"))])
+    def solid1(_):
+        return Output(None, "output1", metadata_entries=output_metadata)
+
+    @pipeline
+    def my_pipeline():
+        solid1()
+
+    result = execute_pipeline(my_pipeline)
+    materializations = [
+        event
+        for event in result.step_event_list
+        if event.event_type_value == "ASSET_MATERIALIZATION"
+    ]
+    assert len(materializations) == 1
+
+    metadata_entries = materializations[0].event_specific_data.materialization.metadata_entries
+    assert metadata_entries == output_metadata
+    assert metadata_entries is not output_metadata
+
+
 def test_io_manager_single_partition_materialization():
 
     entry1 = EventMetadataEntry.int(123, "nrows")
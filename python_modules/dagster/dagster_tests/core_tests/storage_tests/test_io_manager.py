@@ -1,5 +1,6 @@
 import os
 import tempfile
+import threading
 
 import mock
 import pytest
@@ -24,12 +25,14 @@
 )
 from dagster.check import CheckError
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
+from dagster.core.events import DagsterEventType
 from dagster.core.execution.api import create_execution_plan, execute_plan
 from dagster.core.execution.context.output import get_output_context
 from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.storage.fs_io_manager import custom_path_fs_io_manager, fs_io_manager
 from dagster.core.storage.io_manager import IOManager, io_manager
 from dagster.core.storage.mem_io_manager import InMemoryIOManager, mem_io_manager
+from dagster.core.storage.tags import MAX_CONCURRENT_IO_TAG
 from dagster.core.system_config.objects import ResolvedRunConfig
 
 
@@ -713,3 +716,167 @@ def single_solid_pipeline():
         event for event in result.event_list if event.event_type_value == "STEP_FAILURE"
     ][0]
     assert step_failure.event_specific_data.error.cls_name == "DagsterExecutionHandleOutputError"
+
+
+def test_concurrent_input_loading():
+    # both loads must be in flight at the same time for the barrier to release
+    barrier = threading.Barrier(2, timeout=10)
+    # finish loading "b" before "a", so that the loads complete out of declaration order
+    b_loaded = threading.Event()
+
+    class BarrierIOManager(InMemoryIOManager):
+        def load_input(self, context):
+            barrier.wait()
+            if context.name == "a":
+                assert b_loaded.wait(timeout=10)
+            value = super(BarrierIOManager, self).load_input(context)
+            if context.name == "b":
+                b_loaded.set()
+            return value
+
+    @io_manager
+    def barrier_io_manager(_):
+        return BarrierIOManager()
+
+    @solid
+    def emit_one():
+        return 1
+
+    @solid
+    def emit_two():
+        return 2
+
+    @solid
+    def add(_, a, b):
+        return a + b
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": barrier_io_manager})])
+    def concurrent_pipeline():
+        add(emit_one(), emit_two())
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        concurrent_pipeline, tags={MAX_CONCURRENT_IO_TAG: "2"}, instance=instance
+    )
+    assert result.success
+    assert result.result_for_solid("add").output_value() == 3
+
+    loaded_inputs = [
+        event.event_specific_data.input_name
+        for event in result.step_event_list
+        if event.event_type_value == "LOADED_INPUT"
+    ]
+    assert loaded_inputs == ["a", "b"]
+
+    logged_inputs = [
+        record.dagster_event.event_specific_data.input_name
+        for record in instance.all_logs(result.run_id, of_type=DagsterEventType.LOADED_INPUT)
+    ]
+    assert logged_inputs == ["a", "b"]
+
+
+def test_concurrent_input_loading_opt_out():
+    load_threads = []
+
+    class SerialIOManager(InMemoryIOManager):
+        supports_concurrent_load_input = False
+
+        def load_input(self, context):
+            load_threads.append(threading.current_thread())
+            return super(SerialIOManager, self).load_input(context)
+
+    @io_manager
+    def serial_io_manager(_):
+        return SerialIOManager()
+
+    @solid
+    def emit_one():
+        return 1
+
+    @solid
+    def emit_two():
+        return 2
+
+    @solid
+    def add(_, a, b):
+        return a + b
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": serial_io_manager})])
+    def serial_pipeline():
+        add(emit_one(), emit_two())
+
+    result = execute_pipeline(serial_pipeline, tags={MAX_CONCURRENT_IO_TAG: "2"})
+    assert result.success
+    assert result.result_for_solid("add").output_value() == 3
+    assert load_threads == [threading.current_thread()] * 2
+
+
+@pytest.mark.parametrize(
+    "run_tags,solid_tags,concurrent",
+    [
+        ({}, {MAX_CONCURRENT_IO_TAG: "2"}, True),
+        ({MAX_CONCURRENT_IO_TAG: "1"}, {MAX_CONCURRENT_IO_TAG: "2"}, True),
+        ({MAX_CONCURRENT_IO_TAG: "2"}, {MAX_CONCURRENT_IO_TAG: "1"}, False),
+        ({MAX_CONCURRENT_IO_TAG: "2"}, {}, True),
+    ],
+)
+def test_max_concurrent_io_solid_tag_overrides_run_tag(run_tags, solid_tags, concurrent):
+    load_threads = []
+
+    class RecordingIOManager(InMemoryIOManager):
+        def load_input(self, context):
+            load_threads.append(threading.current_thread())
+            return super(RecordingIOManager, self).load_input(context)
+
+    @io_manager
+    def recording_io_manager(_):
+        return RecordingIOManager()
+
+    @solid
+    def emit_one():
+        return 1
+
+    @solid
+    def emit_two():
+        return 2
+
+    @solid(tags=solid_tags)
+    def add(_, a, b):
+        return a + b
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": recording_io_manager})])
+    def tagged_pipeline():
+        add(emit_one(), emit_two())
+
+    result = execute_pipeline(tagged_pipeline, tags=run_tags)
+    assert result.success
+    assert result.result_for_solid("add").output_value() == 3
+    assert len(load_threads) == 2
+    assert (threading.current_thread() not in load_threads) == concurrent
+
+
+def test_handle_output_returns_list():
+    class ListIOManager(InMemoryIOManager):
+        def handle_output(self, context, obj):
+            super(ListIOManager, self).handle_output(context, obj)
+            return [AssetMaterialization(asset_key="a"), AssetMaterialization(asset_key="b")]
+
+    @io_manager
+    def list_io_manager(_):
+        return ListIOManager()
+
+    @solid
+    def basic_solid():
+        return 5
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"io_manager": list_io_manager})])
+    def single_solid_pipeline():
+        basic_solid()
+
+    result = execute_pipeline(single_solid_pipeline)
+    assert result.success
+    assert [
+        event.event_specific_data.materialization.asset_key.path
+        for event in result.step_event_list
+        if event.event_type_value == "ASSET_MATERIALIZATION"
+    ] == [["a"], ["b"]]